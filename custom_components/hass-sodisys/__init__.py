@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-import datetime
+import asyncio
 import logging
+import time
 import zoneinfo
-from datetime import timedelta
-from typing import TYPE_CHECKING
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta, tzinfo
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.exceptions import ConfigEntryNotReady
@@ -15,30 +17,72 @@ from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, Upda
 from sodisys import Sodisys
 
 from .const import (
-    ATTR_CHECK_IN_TIME,
-    ATTR_CHECK_OUT_TIME,
-    ATTR_CHECKED_IN,
+    ACTIVE_DAYS,
+    ACTIVE_HOURS_END,
+    ACTIVE_HOURS_START,
     ATTR_CHILD_ID,
-    ATTR_LAST_UPDATED,
     ATTR_NAME,
+    CONF_KINDERGARTEN_ZONE,
     CONF_TIMEZONE,
     CONF_UPDATE_INTERVAL,
+    DEFAULT_KINDERGARTEN_ZONE,
     DEFAULT_TIMEZONE,
     DEFAULT_UPDATE_INTERVAL,
     DOMAIN,
+    IDLE_UPDATE_INTERVAL,
 )
+from .device import create_child_device_info
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
     from sodisys.rest_api.model import LiveResponse
 
+    SodisysConfigEntry = ConfigEntry["SodisysDataUpdateCoordinator"]
+
 _LOGGER = logging.getLogger(__name__)
 
+# How long cached account details stay valid before they are refetched.
+USER_DETAILS_TTL = 3600  # seconds
+
+# Resolved timezones, shared across config entries.
+_TZ_CACHE: dict[str, tzinfo] = {}
+
+
+def _get_tz(name: str) -> tzinfo:
+    """Resolve a timezone name, falling back to UTC, and cache the result."""
+    tz = _TZ_CACHE.get(name)
+    if tz is None:
+        try:
+            tz = zoneinfo.ZoneInfo(name)
+        except zoneinfo.ZoneInfoNotFoundError:
+            _LOGGER.warning("Could not load timezone %s, using UTC", name)
+            tz = UTC
+        _TZ_CACHE[name] = tz
+    return tz
+
+
+@dataclass(slots=True)
+class ChildState:
+    """Processed state for one child, rebuilt once per coordinator refresh."""
+
+    child_id: str
+    name: str
+    checked_in: bool = False
+    check_in_time: datetime | None = None
+    check_out_time: datetime | None = None
+    check_in_time_iso: str | None = None
+    check_out_time_iso: str | None = None
+    last_updated: datetime | None = None
+    last_updated_iso: str | None = None
+    device_info: DeviceInfo | None = None
+
+
 PLATFORMS: list[Platform] = [Platform.DEVICE_TRACKER, Platform.SENSOR]
 
 
-async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
+async def async_setup_entry(hass: HomeAssistant, entry: SodisysConfigEntry) -> bool:
     """Set up Sodisys from a config entry."""
     session = async_get_clientsession(hass)
     sodisys = Sodisys(session)
@@ -52,12 +96,12 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         raise ConfigEntryNotReady(msg) from err
 
     # Get configuration values, preferring options over data
-    update_interval = entry.options.get(
-        CONF_UPDATE_INTERVAL,
-        entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL),
+    update_interval = _get_entry_option(
+        entry, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
     )
-    timezone = entry.options.get(
-        CONF_TIMEZONE, entry.data.get(CONF_TIMEZONE, DEFAULT_TIMEZONE)
+    timezone = _get_entry_option(entry, CONF_TIMEZONE, DEFAULT_TIMEZONE)
+    kindergarten_zone = _get_entry_option(
+        entry, CONF_KINDERGARTEN_ZONE, DEFAULT_KINDERGARTEN_ZONE
     )
 
     # Create data update coordinator
@@ -66,13 +110,13 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         sodisys,
         update_interval,
         timezone,
+        kindergarten_zone,
     )
 
     # Fetch initial data so we have data when entities subscribe
     await coordinator.async_config_entry_first_refresh()
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    entry.runtime_data = coordinator
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -82,17 +126,40 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     return True
 
 
-async def async_update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
+def _get_entry_option(entry: ConfigEntry, key: str, default: object) -> Any:
+    """Read a config entry value, preferring options over data."""
+    return entry.options.get(key, entry.data.get(key, default))
+
+
+async def async_update_options(
+    _hass: HomeAssistant, entry: SodisysConfigEntry
+) -> None:
     """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    # Apply the new options in place; a full reload would tear down the
+    # coordinator and needlessly re-login with unchanged credentials.
+    coordinator = entry.runtime_data
 
+    update_interval = _get_entry_option(
+        entry, CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+    )
+    timezone = _get_entry_option(entry, CONF_TIMEZONE, DEFAULT_TIMEZONE)
+
+    coordinator.base_update_interval = timedelta(seconds=update_interval)
+    coordinator.update_interval = coordinator.base_update_interval
+    if timezone != coordinator.timezone_str:
+        coordinator.set_timezone(timezone)
+    coordinator.kindergarten_zone = _get_entry_option(
+        entry, CONF_KINDERGARTEN_ZONE, DEFAULT_KINDERGARTEN_ZONE
+    )
 
-async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
-    """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
-        hass.data[DOMAIN].pop(entry.entry_id)
+    # Reschedule the pending refresh; otherwise a shorter interval only
+    # takes effect once the old (possibly idle, 30 min) timer fires.
+    await coordinator.async_request_refresh()
 
-    return unload_ok
+
+async def async_unload_entry(hass: HomeAssistant, entry: SodisysConfigEntry) -> bool:
+    """Unload a config entry."""
+    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
 class SodisysDataUpdateCoordinator(DataUpdateCoordinator):
@@ -104,88 +171,200 @@ class SodisysDataUpdateCoordinator(DataUpdateCoordinator):
         sodisys: Sodisys,
         update_interval: int,
         timezone: str,
+        kindergarten_zone: str,
     ) -> None:
         """Initialize."""
         self.sodisys = sodisys
-        self.timezone_str = timezone
+        self.kindergarten_zone = kindergarten_zone
+        self.base_update_interval = timedelta(seconds=update_interval)
+        self.set_timezone(timezone)
+
+        # Account details rarely change, so cache them between refreshes.
+        self._user_details_cache: dict | None = None
+        self._user_details_expires: float = 0.0
+
+        # Fingerprint of the last processed slot, used to skip reprocessing
+        # when nothing changed between polls.
+        self._last_slot_fingerprint: tuple | None = None
+        self._last_child_state: ChildState | None = None
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=update_interval),
+            # Skip the listener broadcast when _process_live_data hands
+            # back the identical ChildState for an unchanged slot.
+            always_update=False,
         )
 
-    async def _async_update_data(self) -> dict:
+    def set_timezone(self, timezone: str) -> None:
+        """Set the timezone used to interpret check-in/check-out timestamps."""
+        self.timezone_str = timezone
+        # Resolved once here; it only changes via the options flow.
+        self._tz: tzinfo = _get_tz(timezone)
+        # The cached state holds timestamps converted with the old
+        # timezone; drop it so the next poll rebuilds rather than
+        # matching the stale fingerprint.
+        self._last_slot_fingerprint = None
+        self._last_child_state = None
+
+    async def _async_update_data(self) -> ChildState | None:
         """Update data via library."""
         try:
-            # Fetch live data from Sodisys
-            live_response = await self.sodisys.get_live()
-            _LOGGER.debug("Fetched live data: %s", live_response)
-            return await self._process_live_data(live_response)
+            if self._user_details_fresh():
+                live_response = await self.sodisys.get_live()
+            else:
+                live_response = await self._fetch_live_and_details()
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("Fetched live data: %s", live_response)
+            child_state = self._process_live_data(live_response)
         except Exception as err:
             _LOGGER.exception("Error communicating with Sodisys API")
+            # Force a fresh account details fetch on the next cycle;
+            # any cached identity stays usable in the meantime.
+            self._user_details_expires = 0.0
             msg = f"Error communicating with API: {err}"
             raise UpdateFailed(msg) from err
+        else:
+            self.update_interval = self._next_update_interval(child_state)
+            return child_state
+
+    def _next_update_interval(self, child_state: ChildState | None) -> timedelta:
+        """
+        Choose the polling interval for the next cycle.
+
+        Poll at the configured rate while the child is checked in or during
+        weekday kindergarten hours; otherwise back off to the idle interval.
+        """
+        if child_state is not None and child_state.checked_in:
+            return self.base_update_interval
+
+        now = datetime.now(tz=self._tz)
+        if (
+            now.weekday() in ACTIVE_DAYS
+            and ACTIVE_HOURS_START <= now.hour < ACTIVE_HOURS_END
+        ):
+            return self.base_update_interval
+
+        return max(self.base_update_interval, timedelta(seconds=IDLE_UPDATE_INTERVAL))
+
+    async def _fetch_live_and_details(self) -> LiveResponse:
+        """Fetch live data and refresh the account details in one round trip."""
+        # Issue both requests together so the account details refresh
+        # does not add a second round trip to the poll.
+        live_response, data_result = await asyncio.gather(
+            self.sodisys.get_live(),
+            self.sodisys.get_data(),
+            return_exceptions=True,
+        )
+        # Store whatever get_data() returned either way: a failed
+        # get_data() still lets live tracking proceed, and successfully
+        # fetched details are kept even when get_live() failed.
+        self._store_user_details(data_result)
+        if isinstance(live_response, BaseException):
+            raise live_response
+        return live_response
+
+    def _user_details_fresh(self) -> bool:
+        """Return True if the cached account details are still valid."""
+        return (
+            self._user_details_cache is not None
+            and time.monotonic() < self._user_details_expires
+        )
 
-    async def _process_live_data(self, live_response: LiveResponse) -> dict:
-        """Process live data from Sodisys into child tracker format."""
+    def _store_user_details(self, data_result: object) -> None:
+        """Cache account details from a get_data() result or exception."""
+        if isinstance(data_result, BaseException):
+            _LOGGER.warning("Could not fetch child data: %s", data_result)
+            # Keep any stale details rather than dropping the child identity;
+            # the expired TTL means the next cycle retries the fetch.
+            return
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("data fetched: %s", data_result)
+        details = data_result.user_details
+        user_details = {
+            ATTR_CHILD_ID: details.id,
+            ATTR_NAME: f"{details.firstname} {details.lastname}",
+        }
+        if user_details != self._user_details_cache:
+            # Changed identity must not be masked by the unchanged-slot
+            # short-circuit in _process_live_data.
+            self._last_slot_fingerprint = None
+            self._last_child_state = None
+        self._user_details_cache = user_details
+        self._user_details_expires = time.monotonic() + USER_DETAILS_TTL
+
+    def _process_live_data(self, live_response: LiveResponse) -> ChildState | None:
+        """Process live data from Sodisys into child tracker state."""
         try:
-            children_data = {}
-
-            try:
-                data_response = await self.sodisys.get_data()
-                _LOGGER.debug("data fetched: %s", data_response)
-                user_details = data_response.user_details
-                children_data[ATTR_CHILD_ID] = user_details.id
-                children_data[ATTR_NAME] = (
-                    f"{user_details.firstname} {user_details.lastname}"
-                )
-
-            except Exception as err:
-                _LOGGER.warning("Could not fetch child data: %s", err)
-            else:
-                if live_response.last_slot is not None:
-                    last_slot = live_response.last_slot
-                    _LOGGER.debug("Processing last slot: %s", last_slot)
-
-                    tz = datetime.UTC
-                    try:
-                        tz = zoneinfo.ZoneInfo(self.timezone_str)
-                    except zoneinfo.ZoneInfoNotFoundError:
-                        _LOGGER.warning(
-                            "Could not load timezone %s, using UTC",
-                            self.timezone_str,
-                        )
-
-                    checked_in = False
-                    check_in_time: datetime.datetime | None = None
-                    check_out_time: datetime.datetime | None = None
-
-                    if last_slot.in_time is not None:
-                        check_in_time = last_slot.get_checkin_timestamp(tz)
-
-                    # Get check-out timestamp
-                    if last_slot.out_time is not None:
-                        check_out_time = last_slot.get_checkout_timestamp(tz)
-
-                    # Child is checked in if there's a check-in but no check-out
-                    if check_in_time is not None and check_out_time is None:
-                        checked_in = True
-
-                    children_data[ATTR_CHECKED_IN] = checked_in
-
-                    if check_in_time is not None:
-                        children_data[ATTR_CHECK_IN_TIME] = check_in_time
-
-                    if check_out_time is not None:
-                        children_data[ATTR_CHECK_OUT_TIME] = check_out_time
-
-            children_data[ATTR_LAST_UPDATED] = datetime.datetime.now(tz=datetime.UTC)
+            fingerprint = (
+                getattr(live_response.last_slot, "in_time", None),
+                getattr(live_response.last_slot, "out_time", None),
+            )
+            if (
+                fingerprint == self._last_slot_fingerprint
+                and self._last_child_state is not None
+            ):
+                # Nothing changed since the last poll; hand back the same
+                # state object so entity state writes see identical values
+                # (last_updated then reflects the last actual change).
+                return self._last_child_state
+
+            user_details = self._user_details_cache
+            if user_details is None:
+                # Without account details there is no child identity to
+                # publish; keep the previous state until the fetch succeeds.
+                self._last_slot_fingerprint = None
+                self._last_child_state = None
+                return self.data
+
+            checked_in = False
+            check_in_time: datetime | None = None
+            check_out_time: datetime | None = None
+
+            last_slot = live_response.last_slot
+            if last_slot is not None:
+                _LOGGER.debug("Processing last slot: %s", last_slot)
+
+                if last_slot.in_time is not None:
+                    check_in_time = last_slot.get_checkin_timestamp(self._tz)
+
+                if last_slot.out_time is not None:
+                    check_out_time = last_slot.get_checkout_timestamp(self._tz)
+
+                # Child is checked in if there's a check-in but no check-out
+                checked_in = check_in_time is not None and check_out_time is None
+
+            last_updated = datetime.now(tz=UTC)
+            child_state = ChildState(
+                child_id=user_details[ATTR_CHILD_ID],
+                name=user_details[ATTR_NAME],
+                checked_in=checked_in,
+                check_in_time=check_in_time,
+                check_out_time=check_out_time,
+                check_in_time_iso=(
+                    check_in_time.isoformat() if check_in_time else None
+                ),
+                check_out_time_iso=(
+                    check_out_time.isoformat() if check_out_time else None
+                ),
+                last_updated=last_updated,
+                last_updated_iso=last_updated.isoformat(),
+                # Memoized in device.py, so this is a lookup after the
+                # first cycle.
+                device_info=create_child_device_info(
+                    user_details[ATTR_CHILD_ID], user_details[ATTR_NAME]
+                ),
+            )
+
+            self._last_slot_fingerprint = fingerprint
+            self._last_child_state = child_state
 
         except Exception as err:
             _LOGGER.exception("Error processing live data")
             msg = f"Error processing live data: {err}"
             raise UpdateFailed(msg) from err
         else:
-            return children_data
+            return child_state
@@ -31,15 +31,27 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+_UPDATE_INTERVAL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=60, max=3600))
+
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_USERNAME): str,
         vol.Required(CONF_PASSWORD): str,
         vol.Optional(CONF_KINDERGARTEN_ZONE, default=DEFAULT_KINDERGARTEN_ZONE): str,
         vol.Optional(CONF_TIMEZONE, default=DEFAULT_TIMEZONE): str,
-        vol.Optional(CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL): vol.All(
-            vol.Coerce(int), vol.Range(min=60, max=3600)
-        ),
+        vol.Optional(
+            CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+        ): _UPDATE_INTERVAL_VALIDATOR,
+    }
+)
+
+OPTIONS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_KINDERGARTEN_ZONE, default=DEFAULT_KINDERGARTEN_ZONE): str,
+        vol.Optional(CONF_TIMEZONE, default=DEFAULT_TIMEZONE): str,
+        vol.Optional(
+            CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+        ): _UPDATE_INTERVAL_VALIDATOR,
     }
 )
 
@@ -73,10 +85,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     @staticmethod
     def async_get_options_flow(
-        config_entry: config_entries.ConfigEntry,
+        _config_entry: config_entries.ConfigEntry,
     ) -> SodisysOptionsFlow:
         """Create the options flow."""
-        return SodisysOptionsFlow(config_entry)
+        # OptionsFlow takes no arguments; the config_entry property is
+        # provided by Home Assistant when the flow starts.
+        return SodisysOptionsFlow()
 
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
@@ -108,79 +122,39 @@ class CannotConnectError(HomeAssistantError):
 class InvalidAuthError(HomeAssistantError):
     """Error to indicate there is invalid auth."""
 
-    async def async_step_init(
-        self, user_input: dict[str, Any] | None = None
-    ) -> FlowResult:
-        """Manage the options."""
-        if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
-
-        return self.async_show_form(
-            step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_KINDERGARTEN_ZONE,
-                        default=self.config_entry.data.get(
-                            CONF_KINDERGARTEN_ZONE, DEFAULT_KINDERGARTEN_ZONE
-                        ),
-                    ): str,
-                    vol.Optional(
-                        CONF_TIMEZONE,
-                        default=self.config_entry.data.get(
-                            CONF_TIMEZONE, DEFAULT_TIMEZONE
-                        ),
-                    ): str,
-                    vol.Optional(
-                        CONF_UPDATE_INTERVAL,
-                        default=self.config_entry.data.get(
-                            CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
-                }
-            ),
-        )
-
 
 class SodisysOptionsFlow(config_entries.OptionsFlow):
     """Handle options flow for Sodisys."""
 
-    async def async_step_user(
+    async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
         if user_input is not None:
             return self.async_create_entry(title="", data=user_input)
 
+        suggested_values = {
+            CONF_KINDERGARTEN_ZONE: self.config_entry.options.get(
+                CONF_KINDERGARTEN_ZONE,
+                self.config_entry.data.get(
+                    CONF_KINDERGARTEN_ZONE, DEFAULT_KINDERGARTEN_ZONE
+                ),
+            ),
+            CONF_TIMEZONE: self.config_entry.options.get(
+                CONF_TIMEZONE,
+                self.config_entry.data.get(CONF_TIMEZONE, DEFAULT_TIMEZONE),
+            ),
+            CONF_UPDATE_INTERVAL: self.config_entry.options.get(
+                CONF_UPDATE_INTERVAL,
+                self.config_entry.data.get(
+                    CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
+                ),
+            ),
+        }
+
         return self.async_show_form(
             step_id="init",
-            data_schema=vol.Schema(
-                {
-                    vol.Optional(
-                        CONF_KINDERGARTEN_ZONE,
-                        default=self.config_entry.options.get(
-                            CONF_KINDERGARTEN_ZONE,
-                            self.config_entry.data.get(
-                                CONF_KINDERGARTEN_ZONE, DEFAULT_KINDERGARTEN_ZONE
-                            ),
-                        ),
-                    ): str,
-                    vol.Optional(
-                        CONF_TIMEZONE,
-                        default=self.config_entry.options.get(
-                            CONF_TIMEZONE,
-                            self.config_entry.data.get(CONF_TIMEZONE, DEFAULT_TIMEZONE),
-                        ),
-                    ): str,
-                    vol.Optional(
-                        CONF_UPDATE_INTERVAL,
-                        default=self.config_entry.options.get(
-                            CONF_UPDATE_INTERVAL,
-                            self.config_entry.data.get(
-                                CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL
-                            ),
-                        ),
-                    ): vol.All(vol.Coerce(int), vol.Range(min=60, max=3600)),
-                }
+            data_schema=self.add_suggested_values_to_schema(
+                OPTIONS_SCHEMA, suggested_values
             ),
         )
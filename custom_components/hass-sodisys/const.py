@@ -19,6 +19,12 @@ DEFAULT_KINDERGARTEN_ZONE: Final = "kindergarten"
 # Common timezone for German kindergartens
 DEFAULT_TIMEZONE: Final = "Europe/Berlin"
 
+# Adaptive polling: outside kindergarten hours nothing changes, so poll slowly
+IDLE_UPDATE_INTERVAL: Final = 1800  # 30 minutes
+ACTIVE_HOURS_START: Final = 7
+ACTIVE_HOURS_END: Final = 18
+ACTIVE_DAYS: Final = (0, 1, 2, 3, 4)  # Monday to Friday
+
 # Device tracker states
 STATE_HOME: Final = "home"
 STATE_NOT_HOME: Final = "not_home"
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+from functools import lru_cache
 
 from homeassistant.helpers.device_registry import DeviceInfo
 
 from .const import (
-    ATTR_CHILD_ID,
     DEVICE_MANUFACTURER,
     DEVICE_MODEL_CHILD,
     DEVICE_SW_VERSION,
@@ -15,23 +14,19 @@ from .const import (
 )
 
 
-def create_child_device_info(child_data: dict[str, Any]) -> DeviceInfo:
+@lru_cache(maxsize=128)
+def create_child_device_info(unique_id: str, child_name: str) -> DeviceInfo:
     """
-    Create device info for a child device.
+    Create (and memoize) device info for a child device.
 
     Args:
-        child_data: Dictionary containing child information with keys:
-            - unique_id: Unique identifier for the child (from UserDetails.id)
-            - name: Child's full name (from UserDetails.firstname + lastname)
-            - id: Child ID used internally by Sodisys
+        unique_id: Unique identifier for the child (from UserDetails.id)
+        child_name: Child's full name (from UserDetails.firstname + lastname)
 
     Returns:
         DeviceInfo dictionary for Home Assistant device registry
 
     """
-    unique_id = child_data.get("unique_id", child_data.get(ATTR_CHILD_ID, "unknown"))
-    child_name = child_data.get("name", f"Child {unique_id}")
-
     return DeviceInfo(
         identifiers={(DOMAIN, f"child_{unique_id}")},
         name=child_name,
@@ -41,32 +36,30 @@ def create_child_device_info(child_data: dict[str, Any]) -> DeviceInfo:
     )
 
 
-def get_child_device_identifier(child_data: dict[str, Any]) -> str:
+def get_child_device_identifier(unique_id: str) -> str:
     """
     Get the device identifier for a child.
 
     Args:
-        child_data: Dictionary containing child information
+        unique_id: Unique identifier for the child
 
     Returns:
         Device identifier string used in Home Assistant device registry
 
     """
-    unique_id = child_data.get("unique_id", child_data.get(ATTR_CHILD_ID, "unknown"))
     return f"child_{unique_id}"
 
 
-def create_entity_unique_id(child_data: dict[str, Any], entity_type: str) -> str:
+def create_entity_unique_id(unique_id: str, entity_type: str) -> str:
     """
     Create a unique entity ID for a child entity.
 
     Args:
-        child_data: Dictionary containing child information
+        unique_id: Unique identifier for the child
         entity_type: Type of entity (e.g., "tracker", "checkin", "checkout", "binary_sensor")
 
     Returns:
         Unique entity ID string
 
     """
-    unique_id = child_data.get("unique_id", child_data.get(ATTR_CHILD_ID, "unknown"))
     return f"sodisys_{entity_type}_{unique_id}"
@@ -0,0 +1,41 @@
+"""Base entity for the Sodisys integration."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.core import callback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+if TYPE_CHECKING:
+    from . import ChildState, SodisysDataUpdateCoordinator
+
+
+class SodisysEntity(CoordinatorEntity):
+    """Common base class for Sodisys coordinator entities."""
+
+    __slots__ = ("_child_data",)
+
+    def __init__(self, coordinator: SodisysDataUpdateCoordinator) -> None:
+        """Initialize and snapshot the current coordinator state."""
+        super().__init__(coordinator)
+        self._child_data: ChildState | None = coordinator.data
+        self._attr_available = (
+            coordinator.last_update_success and coordinator.data is not None
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Snapshot state and availability once per refresh."""
+        self._child_data = self.coordinator.data
+        self._attr_available = (
+            self.coordinator.last_update_success and self._child_data is not None
+        )
+        super()._handle_coordinator_update()
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        # Computed once per refresh; CoordinatorEntity would otherwise
+        # re-derive this on every state write.
+        return self._attr_available
@@ -5,77 +5,79 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING, Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import (
-    ATTR_CHECK_IN_TIME,
-    ATTR_CHECKED_IN,
-    ATTR_CHILD_ID,
-    ATTR_LAST_UPDATED,
-    ATTR_NAME,
-    DOMAIN,
-)
-from .device import (
-    create_child_device_info,
-    create_entity_unique_id,
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
 )
+from homeassistant.core import HomeAssistant, callback
+
+from .device import create_entity_unique_id
+from .entity import SodisysEntity
 
 if TYPE_CHECKING:
     from datetime import datetime
 
-    from homeassistant.config_entries import ConfigEntry
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-    from custom_components.sodisys2 import SodisysDataUpdateCoordinator
+    from . import ChildState, SodisysConfigEntry, SodisysDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# One description per timestamp sensor; the key doubles as the unique_id
+# kind, so existing entity registry entries are preserved.
+SENSOR_DESCRIPTIONS: tuple[SensorEntityDescription, ...] = (
+    SensorEntityDescription(
+        key="checkin",
+        name="Check-in Time",
+        icon="mdi:login",
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+    SensorEntityDescription(
+        key="checkout",
+        name="Check-out Time",
+        icon="mdi:logout",
+        device_class=SensorDeviceClass.TIMESTAMP,
+    ),
+)
+
+# Maps a description key to the ChildState field it exposes
+_FIELD_FOR_KEY = {
+    "checkin": "check_in_time",
+    "checkout": "check_out_time",
+}
+
 
 async def async_setup_entry(
-    hass: HomeAssistant,
-    config_entry: ConfigEntry,
+    _hass: HomeAssistant,
+    config_entry: SodisysConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Sodisys sensors from config entry."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = config_entry.runtime_data
 
-    entities = []
+    entities: dict[tuple[str, str], SensorEntity] = {}
 
     @callback
     def async_add_child_sensors() -> None:
         """Add child sensors when data is available."""
-        if not coordinator.data:
+        child_data = coordinator.data
+        if not child_data:
             return
 
-        new_entities = []
-        child_data = coordinator.data
-        child_id = child_data[ATTR_CHILD_ID]
-        # Check if we already have entities for this child
-        existing_checkin = None
-        existing_checkout = None
-
-        for entity in entities:
-            if hasattr(entity, "child_id") and entity.child_id == child_id:
-                if isinstance(entity, SodisysCheckinSensor):
-                    existing_checkin = entity
-                elif isinstance(entity, SodisysCheckoutSensor):
-                    existing_checkout = entity
-
-        # Add check-in sensor if not exists
-        if not existing_checkin:
-            new_entities.append(SodisysCheckinSensor(coordinator, child_id, child_data))
-
-        # Add check-out sensor if not exists
-        if not existing_checkout:
-            new_entities.append(
-                SodisysCheckoutSensor(coordinator, child_id, child_data)
-            )
+        # Bail out early on the common case: the child is already known
+        child_id = child_data.child_id
+        new_entities = [
+            SodisysTimestampSensor(coordinator, child_id, child_data, description)
+            for description in SENSOR_DESCRIPTIONS
+            if (child_id, description.key) not in entities
+        ]
+        if not new_entities:
+            return
 
-        if new_entities:
-            entities.extend(new_entities)
-            async_add_entities(new_entities)
+        for entity in new_entities:
+            entities[(child_id, entity.entity_description.key)] = entity
+        async_add_entities(new_entities)
 
     # Add initial entities
     async_add_child_sensors()
@@ -84,107 +86,53 @@ async def async_setup_entry(
     coordinator.async_add_listener(async_add_child_sensors)
 
 
-class SodisysBaseSensor(CoordinatorEntity, SensorEntity):
-    """Base class for Sodisys sensors."""
+class SodisysTimestampSensor(SodisysEntity, SensorEntity):
+    """Timestamp sensor for a child, driven by its entity description."""
+
+    __slots__ = ("_field", "child_id")
 
     def __init__(
-        self, coordinator: SodisysDataUpdateCoordinator, child_id: str, child_data: dict
+        self,
+        coordinator: SodisysDataUpdateCoordinator,
+        child_id: str,
+        child_data: ChildState,
+        description: SensorEntityDescription,
     ) -> None:
-        _LOGGER.debug("Initializing SodisysBaseSensor for child %s", child_id)
-        _LOGGER.debug("Child data: %s", child_data)
         """Initialize the sensor."""
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Initializing %s sensor for child %s", description.key, child_id
+            )
         super().__init__(coordinator)
+        self.entity_description = description
         self.child_id = child_id
-        self._child_name = child_data.get(ATTR_NAME, f"Child {child_id}")
-
-        # Set device info to group this entity under the child device
-        self._attr_device_info = create_child_device_info(child_data)
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return (
-            self.coordinator.last_update_success and self.coordinator.data is not None
-        )
-
-
-class SodisysCheckinSensor(SodisysBaseSensor):
-    """Sensor for child check-in time."""
-
-    def __init__(
-        self, coordinator: SodisysDataUpdateCoordinator, child_id: str, child_data: dict
-    ) -> None:
-        """Initialize the check-in sensor."""
-        super().__init__(coordinator, child_id, child_data)
+        self._field = _FIELD_FOR_KEY[description.key]
 
         # Set up entity attributes
-        self._attr_unique_id = create_entity_unique_id(child_data, "checkin")
-        self._attr_name = f"{self._child_name} Check-in Time"
-        self._attr_icon = "mdi:login"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        self._attr_unique_id = create_entity_unique_id(child_id, description.key)
+        self._attr_name = f"{child_data.name} {description.name}"
 
-    @property
-    def native_value(self) -> datetime | None:
-        """Return the check-in time."""
-        child_data = self.coordinator.data
-        return child_data.get("check_in_time")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional state attributes."""
-        child_data = self.coordinator.data
-
-        attributes = {
-            "child_id": self.child_id,
-            "checked_in": child_data.get(ATTR_CHECKED_IN, False),
-        }
-
-        if child_data.get(ATTR_LAST_UPDATED):
-            last_updated = child_data[ATTR_LAST_UPDATED]
-            if hasattr(last_updated, "isoformat"):
-                attributes["last_updated"] = last_updated.isoformat()
-            else:
-                attributes["last_updated"] = str(last_updated)
-
-        return attributes
-
-
-class SodisysCheckoutSensor(SodisysBaseSensor):
-    """Sensor for child check-out time."""
-
-    def __init__(
-        self, coordinator: SodisysDataUpdateCoordinator, child_id: str, child_data: dict
-    ) -> None:
-        """Initialize the check-out sensor."""
-        super().__init__(coordinator, child_id, child_data)
-
-        # Set up entity attributes
-        self._attr_unique_id = create_entity_unique_id(child_data, "checkout")
-        self._attr_name = f"{self._child_name} Check-out Time"
-        self._attr_icon = "mdi:logout"
-        self._attr_device_class = SensorDeviceClass.TIMESTAMP
+        # Group this entity under the child device; the coordinator shares
+        # one DeviceInfo per refresh across all of the child's entities
+        self._attr_device_info = child_data.device_info
 
     @property
     def native_value(self) -> datetime | None:
-        """Return the check-out time."""
-        child_data = self.coordinator.data
-        return child_data.get("check_out_time")
+        """Return the timestamp this sensor exposes."""
+        child_data = self._child_data
+        return getattr(child_data, self._field) if child_data else None
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional state attributes."""
-        child_data = self.coordinator.data
+        child_data = self._child_data
 
         attributes = {
             "child_id": self.child_id,
-            "checked_in": child_data.get(ATTR_CHECK_IN_TIME, False),
+            "checked_in": child_data.checked_in if child_data else False,
         }
 
-        if child_data.get(ATTR_LAST_UPDATED):
-            last_updated = child_data[ATTR_LAST_UPDATED]
-            if hasattr(last_updated, "isoformat"):
-                attributes["last_updated"] = last_updated.isoformat()
-            else:
-                attributes["last_updated"] = str(last_updated)
+        if child_data and child_data.last_updated_iso:
+            attributes["last_updated"] = child_data.last_updated_iso
 
         return attributes